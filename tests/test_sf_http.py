@@ -0,0 +1,191 @@
+import os
+import json
+import time
+import threading
+import unittest
+from unittest import mock
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+for _name in ("SF_CONSUMER_KEY", "SF_CONSUMER_SECRET", "SF_USERNAME", "SF_PASSWORD"):
+    os.environ.setdefault(_name, "test")
+
+from tools._sf_client import _CLIENT, _EXPIRY_MARGIN, SalesforceClient
+from tools._sf_http import _SESSION, SalesforceError
+from tools.opp_salesforce_tools import _LIST_CACHE, _set_cached_list
+from tools.salesforce_tool import execute_composite, execute_soql_query, fetch_case_comments
+
+class _LocalSalesforce(BaseHTTPRequestHandler):
+    """
+    Answers with the server's queued (status, body) replies, HTTP 500 once they run out.
+    """
+
+    def _reply(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        self.server.received.append((self.command, self.path, dict(self.headers), self.rfile.read(length)))
+
+        status, body = self.server.replies.pop(0) if self.server.replies else (500, [{"errorCode": "SERVER_ERROR"}])
+        payload = b'' if status == 204 else json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = do_PATCH = do_DELETE = _reply
+
+    def log_message(self, *args):
+        pass
+
+class LocalServerTest(unittest.TestCase):
+    """
+    Runs a local plain-HTTP Salesforce stand-in and points the shared client at it.
+    """
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), _LocalSalesforce)
+        self.server.replies = []
+        self.server.received = []
+        self.url = f'http://127.0.0.1:{self.server.server_port}'
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+        # Route the local server through the same retrying adapter as the instance
+        self.previous_adapter = _SESSION.adapters.get('http://')
+        _SESSION.mount('http://', _SESSION.get_adapter('https://'))
+        _CLIENT._auth = (self.url, {'Authorization': 'Bearer test'})
+        _CLIENT._exp = time.monotonic() + 7200
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        _SESSION.mount('http://', self.previous_adapter)
+        _CLIENT.invalidate()
+
+    def token(self, access_token, expires_in=7200):
+        return (200, {'access_token': access_token, 'instance_url': self.url, 'expires_in': expires_in})
+
+    def authenticating_client(self):
+        """
+        A client without a cached token that authenticates against the local server.
+        """
+        patcher = mock.patch('tools._sf_client.AUTH_URL', f'{self.url}/services/oauth2/token')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return SalesforceClient()
+
+class ServerErrorTest(LocalServerTest):
+    """
+    A 5xx that outlasts the adapter's retries must surface as the tool's error message.
+    """
+
+    def test_fetch_case_comments_reports_server_error(self):
+        result = fetch_case_comments.entrypoint('00001026')
+        self.assertTrue(result.startswith('*❌ Error fetching case comments: 500,'), result)
+
+    def test_execute_soql_query_reports_server_error(self):
+        result = execute_soql_query.entrypoint('SELECT Id FROM Case')
+        self.assertTrue(result.startswith('*❌ Error executing SOQL query: 500,'), result)
+
+class CredentialsTest(LocalServerTest):
+    """
+    Access tokens are fetched once and reused until they are close to expiry.
+    """
+
+    def test_token_is_reused_across_requests(self):
+        client = self.authenticating_client()
+        self.server.replies = [self.token('A'), (200, {}), (200, {})]
+
+        client.get('/limits')
+        client.get('/limits')
+
+        methods = [method for method, *_ in self.server.received]
+        self.assertEqual(methods, ['POST', 'GET', 'GET'])
+        self.assertEqual(self.server.received[2][2]['Authorization'], 'Bearer A')
+
+    def test_token_close_to_expiry_is_refreshed(self):
+        client = self.authenticating_client()
+        self.server.replies = [self.token('A', expires_in=_EXPIRY_MARGIN - 1), self.token('B')]
+
+        self.assertEqual(client.credentials()[1]['Authorization'], 'Bearer A')
+        self.assertEqual(client.credentials()[1]['Authorization'], 'Bearer B')
+        self.assertEqual(client.credentials()[1]['Authorization'], 'Bearer B')
+        self.assertEqual(len(self.server.received), 2)
+
+    def test_unauthorized_request_reauthenticates_and_retries_once(self):
+        client = self.authenticating_client()
+        self.server.replies = [self.token('A'), (401, []), self.token('B'), (200, {'ok': True})]
+
+        response = client.get('/limits')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.server.received[3][2]['Authorization'], 'Bearer B')
+
+    def test_second_unauthorized_response_is_returned(self):
+        client = self.authenticating_client()
+        self.server.replies = [self.token('A'), (401, []), self.token('B'), (401, [])]
+
+        response = client.get('/limits')
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(len(self.server.received), 4)
+
+class CompositeTest(LocalServerTest):
+    """
+    Composite subrequests are normalised, fully answered, and writes clear the list caches.
+    """
+
+    def tearDown(self):
+        _LIST_CACHE.clear()
+        super().tearDown()
+
+    def sent_subrequests(self):
+        method, path, _, body = self.server.received[-1]
+        self.assertEqual((method, path), ('POST', '/services/data/v57.0/composite'))
+        return json.loads(body)['compositeRequest']
+
+    def test_urls_and_reference_ids_are_normalised(self):
+        self.server.replies = [(200, {'compositeResponse': [{}, {}, {}]})]
+
+        _CLIENT.composite([
+            {'method': 'GET', 'url': 'sobjects/Case/1'},
+            {'method': 'PATCH', 'url': '/sobjects/Case/2', 'referenceId': 'upd', 'body': {}},
+            {'method': 'GET', 'url': '/services/data/v57.0/limits'}
+        ])
+
+        subrequests = self.sent_subrequests()
+        self.assertEqual(
+            [subrequest['url'] for subrequest in subrequests],
+            ['/services/data/v57.0/sobjects/Case/1', '/services/data/v57.0/sobjects/Case/2', '/services/data/v57.0/limits']
+        )
+        self.assertEqual([subrequest['referenceId'] for subrequest in subrequests], ['ref1', 'upd', 'ref3'])
+
+    def test_missing_subresponses_raise(self):
+        self.server.replies = [(200, {'compositeResponse': []})]
+
+        with self.assertRaises(SalesforceError):
+            _CLIENT.composite([{'method': 'DELETE', 'url': '/sobjects/Case/1'}])
+
+    def test_successful_write_clears_its_list_cache(self):
+        _set_cached_list(('opportunities', 50, False), [])
+        _set_cached_list(('leads', 50, False), [])
+        self.server.replies = [(200, {'compositeResponse': [{'referenceId': 'ref1', 'httpStatusCode': 204, 'body': None}]})]
+
+        execute_composite.entrypoint([{'method': 'PATCH', 'url': '/sobjects/Opportunity/006', 'body': {'StageName': 'Closed Won'}}])
+
+        self.assertEqual(list(_LIST_CACHE), [('leads', 50, False)])
+
+    def test_failed_write_keeps_list_cache(self):
+        _set_cached_list(('opportunities', 50, False), [])
+        self.server.replies = [(200, {'compositeResponse': [{'referenceId': 'ref1', 'httpStatusCode': 400, 'body': []}]})]
+
+        execute_composite.entrypoint([{'method': 'PATCH', 'url': '/sobjects/Opportunity/006', 'body': {}}])
+
+        self.assertEqual(list(_LIST_CACHE), [('opportunities', 50, False)])
+
+    def test_invalid_subrequest_is_rejected_before_sending(self):
+        result = execute_composite.entrypoint([{'url': '/sobjects/Case/1'}])
+
+        self.assertTrue(result.startswith('*❌ Invalid subrequest'), result)
+        self.assertEqual(self.server.received, [])
+
+if __name__ == '__main__':
+    unittest.main()
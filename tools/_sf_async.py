@@ -0,0 +1,47 @@
+import asyncio
+import httpx
+from tools._sf_client import _CLIENT as _SF_CLIENT
+
+def async_client():
+    """
+    Create an HTTP/2 client for one async tool call, to be used with `async with`.
+
+    An AsyncClient's pool is bound to the event loop it first runs on, so a module-global
+    client breaks once aprint_response/arun starts a new loop. A client per call still
+    lets that call's concurrent subrequests share one connection to the instance.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=8),
+        timeout=30.0
+    )
+
+async def asf_request(client, method, path, **kwargs):
+    """
+    Send an authenticated request to the Salesforce REST API from async code.
+
+    Shares the cached token of the sync SalesforceClient. On HTTP 401 the cached
+    token is invalidated and the request is retried once.
+
+    Args:
+        client (httpx.AsyncClient): The client of the current tool call, see async_client().
+        method (str): The HTTP method (GET, POST, PATCH, DELETE).
+        path (str): The path relative to the REST API root, e.g. '/query', or an absolute
+            API path such as a query's nextRecordsUrl.
+
+    Returns:
+        httpx.Response: The response of the request.
+    """
+    extra_headers = kwargs.pop('headers', None)
+    if not path.startswith('/services/'):
+        path = _SF_CLIENT.api_path + path
+    for _ in range(2):
+        # Token refresh is blocking, keep it off the event loop
+        instance_url, headers = await asyncio.to_thread(_SF_CLIENT.credentials)
+        if extra_headers:
+            headers = {**headers, **extra_headers}
+        response = await client.request(method, f'{instance_url}{path}', headers=headers, **kwargs)
+        if response.status_code != 401:
+            return response
+        await asyncio.to_thread(_SF_CLIENT.invalidate)
+    return response
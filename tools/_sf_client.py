@@ -0,0 +1,258 @@
+import os
+import time
+import threading
+import orjson
+from cachetools import LRUCache
+from tools._sf_http import _SESSION, DEFAULT_TIMEOUT, SalesforceError, _expect, _iter_page_records, _json, _send
+
+API_VERSION = 'v57.0'
+AUTH_URL = 'https://login.salesforce.com/services/oauth2/token'
+
+# Password-flow tokens don't report a lifetime, assume the default 2h session
+_DEFAULT_TOKEN_LIFETIME = 7200
+# Refresh a token this many seconds before it is due to expire
+_EXPIRY_MARGIN = 300
+
+# Resources whose bodies are kept for conditional GETs, least recently used dropped first
+_ETAG_CACHE_SIZE = 256
+
+# Credentials don't change during the process lifetime, read them once at import
+_REQUIRED_ENV_VARS = ("SF_CONSUMER_KEY", "SF_CONSUMER_SECRET", "SF_USERNAME", "SF_PASSWORD")
+_MISSING_ENV_VARS = [name for name in _REQUIRED_ENV_VARS if not os.getenv(name)]
+if _MISSING_ENV_VARS:
+    raise Exception(f"Missing Salesforce environment variables: {', '.join(_MISSING_ENV_VARS)}")
+
+_CID = os.getenv("SF_CONSUMER_KEY")
+_CSEC = os.getenv("SF_CONSUMER_SECRET")
+_USER = os.getenv("SF_USERNAME")
+_PWTOK = os.getenv("SF_PASSWORD") + os.getenv("SF_SECURITY_TOKEN", "")
+
+_AUTH_DATA = {
+    'grant_type': 'password',
+    'client_id': _CID,
+    'client_secret': _CSEC,
+    'username': _USER,
+    'password': _PWTOK
+}
+
+class SalesforceClient:
+    """
+    Authenticated Salesforce REST client shared by every tool module.
+
+    The access token is fetched with the OAuth 2.0 Password Grant Flow and cached
+    together with the request headers built from it until it is close to expiry.
+    """
+
+    def __init__(self, session=_SESSION, api_version=API_VERSION):
+        self._lock = threading.Lock()
+        self._auth = None  # (instance_url, headers)
+        self._exp = 0.0
+        self._session = session
+        self.api_path = f'/services/data/{api_version}'
+        self._auth_data = _AUTH_DATA
+        # (path, params) -> (last_modified, etag, decoded_json) for conditional GETs
+        self._etag_cache = LRUCache(maxsize=_ETAG_CACHE_SIZE)
+        self._etag_lock = threading.Lock()
+
+    def _cached_auth(self):
+        auth = self._auth
+        if auth is not None and time.monotonic() < self._exp - _EXPIRY_MARGIN:
+            return auth
+        return None
+
+    def credentials(self):
+        """
+        Get the instance URL and authenticated headers, re-authenticating when needed.
+
+        Returns:
+            tuple: A tuple containing (instance_url, headers)
+        """
+        auth = self._cached_auth()
+        if auth is not None:
+            return auth
+
+        with self._lock:
+            # Another thread may have refreshed the token while we waited
+            auth = self._cached_auth()
+            if auth is not None:
+                return auth
+
+            response = self._session.post(AUTH_URL, data=self._auth_data, timeout=DEFAULT_TIMEOUT)
+
+            if response.status_code == 200:
+                response_data = _json(response)
+                headers = {
+                    'Authorization': f"Bearer {response_data.get('access_token')}",
+                    'Content-Type': 'application/json'
+                }
+                self._auth = (response_data.get('instance_url'), headers)
+                self._exp = time.monotonic() + int(response_data.get('expires_in', _DEFAULT_TOKEN_LIFETIME))
+                return self._auth
+            else:
+                raise Exception(f"Error fetching access token: {response.status_code}, {response.text}")
+
+    def invalidate(self):
+        """
+        Drop the cached access token so the next request re-authenticates.
+        """
+        with self._lock:
+            self._auth = None
+            self._exp = 0.0
+
+    def request(self, method, path, **kwargs):
+        """
+        Send an authenticated request to a path relative to the instance URL.
+
+        On HTTP 401 the cached token is invalidated and the request is retried once,
+        HTTP 429 is retried with backoff.
+
+        Args:
+            method (str): The HTTP method (GET, POST, PATCH, DELETE).
+            path (str): The path relative to the instance URL, e.g. a query's nextRecordsUrl.
+
+        Returns:
+            requests.Response: The response of the request.
+        """
+        extra_headers = kwargs.pop('headers', None)
+        kwargs.setdefault('timeout', DEFAULT_TIMEOUT)
+        for _ in range(2):
+            instance_url, headers = self.credentials()
+            if extra_headers:
+                headers = {**headers, **extra_headers}
+            response = _send(self._session.request, method, f'{instance_url}{path}', headers=headers, **kwargs)
+            if response.status_code != 401:
+                return response
+            response.close()
+            self.invalidate()
+        return response
+
+    def get(self, path, **kwargs):
+        """Send a GET to a path relative to the REST API root, e.g. '/query'."""
+        return self.request('GET', self.api_path + path, **kwargs)
+
+    def get_json(self, path, **kwargs):
+        """
+        GET a resource under the REST API root and return its decoded JSON body.
+
+        Bodies that come with Last-Modified or ETag are cached per path and query
+        parameters in a bounded LRU, later fetches send If-Modified-Since/If-None-Match
+        and reuse the cached body on HTTP 304.
+
+        Raises:
+            SalesforceError: If the request fails.
+        """
+        params = kwargs.get('params')
+        if isinstance(params, dict):
+            params = tuple(sorted(params.items()))
+        elif params is not None:
+            params = tuple(params)
+        cache_key = (path, params)
+
+        with self._etag_lock:
+            cached = self._etag_cache.get(cache_key)
+        headers = dict(kwargs.pop('headers', None) or {})
+        if cached is not None:
+            last_modified, etag, _ = cached
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+            if etag:
+                headers['If-None-Match'] = etag
+
+        response = self.get(path, headers=headers, **kwargs)
+
+        if response.status_code == 304 and cached is not None:
+            return cached[2]
+
+        data = _json(_expect(response))
+        last_modified = response.headers.get('Last-Modified')
+        etag = response.headers.get('ETag')
+        if last_modified or etag:
+            with self._etag_lock:
+                self._etag_cache[cache_key] = (last_modified, etag, data)
+        return data
+
+    def iter_query(self, soql_query, fetch_all=False):
+        """
+        Run a SOQL query and yield its records while the response is still streaming.
+
+        Records are decoded incrementally, so memory doesn't scale with the size of
+        the result page. When fetch_all is set, the remaining result pages are
+        followed through nextRecordsUrl. Closing the generator early releases the
+        connection without reading the rest of the body.
+
+        Raises:
+            SalesforceError: If a query page fails.
+        """
+        response = self.get('/query', params={'q': soql_query}, stream=True)
+        while True:
+            # Enter the block before _expect so a failed page is closed as well
+            with response:
+                _expect(response)
+                next_records_url = yield from _iter_page_records(response)
+            if not (fetch_all and next_records_url):
+                return
+            response = self.request('GET', next_records_url, stream=True)
+
+    def composite(self, subrequests, all_or_none=False):
+        """
+        Execute several REST subrequests in a single round trip through the composite resource.
+
+        Subrequest URLs may be absolute API paths or relative to the REST API root,
+        missing referenceIds are filled in as ref1, ref2, ...
+
+        Args:
+            subrequests (list): Dicts with method, url, referenceId and an optional body.
+            all_or_none (bool): Roll back every subrequest if any of them fails.
+
+        Returns:
+            list: The compositeResponse entries, one per subrequest.
+
+        Raises:
+            SalesforceError: If the composite request itself fails or doesn't answer every subrequest.
+        """
+        composite_request = []
+        for index, subrequest in enumerate(subrequests, start=1):
+            url = subrequest['url']
+            if not url.startswith('/'):
+                url = '/' + url
+            if not url.startswith('/services/'):
+                url = self.api_path + url
+            if subrequest['method'].upper() in ('PATCH', 'DELETE') and url.startswith(self.api_path):
+                self.forget(url[len(self.api_path):].split('?', 1)[0])
+            composite_request.append({
+                **subrequest,
+                'url': url,
+                'referenceId': subrequest.get('referenceId') or f'ref{index}'
+            })
+
+        composite_data = {'allOrNone': all_or_none, 'compositeRequest': composite_request}
+        response = _expect(self.post('/composite', json=composite_data))
+        results = _json(response).get('compositeResponse', [])
+        if len(results) != len(composite_request):
+            raise SalesforceError(response.status_code, response.text)
+        return results
+
+    def forget(self, path):
+        """
+        Drop the conditional GET cache entries of a resource that was modified.
+        """
+        with self._etag_lock:
+            for key in [key for key in self._etag_cache if key[0] == path]:
+                self._etag_cache.pop(key, None)
+
+    def post(self, path, json=None, **kwargs):
+        """Send a POST with a JSON body to a path relative to the REST API root."""
+        return self.request('POST', self.api_path + path, data=orjson.dumps(json), **kwargs)
+
+    def patch(self, path, json=None, **kwargs):
+        """Send a PATCH with a JSON body to a path relative to the REST API root."""
+        self.forget(path)
+        return self.request('PATCH', self.api_path + path, data=orjson.dumps(json), **kwargs)
+
+    def delete(self, path, **kwargs):
+        """Send a DELETE to a path relative to the REST API root."""
+        self.forget(path)
+        return self.request('DELETE', self.api_path + path, **kwargs)
+
+# Module-global client so the token cache and connection pool are shared by all tools
+_CLIENT = SalesforceClient()
@@ -0,0 +1,129 @@
+import time
+import ijson
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Default (connect, read) timeout in seconds for every Salesforce request
+DEFAULT_TIMEOUT = (5, 30)
+
+# Upper bound (seconds) on a single rate-limit wait, however long Retry-After asks for
+_RATE_LIMIT_MAX_DELAY = 10
+
+class _CappedRetry(Retry):
+    """
+    Retry that honours Retry-After up to _RATE_LIMIT_MAX_DELAY seconds.
+    """
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, _RATE_LIMIT_MAX_DELAY)
+
+# Shared pooled session so login.salesforce.com and the instance host keep their
+# TLS connections alive between tool calls
+_SESSION = requests.Session()
+_SESSION.mount(
+    'https://',
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        # Hand the last response back once retries run out, so _expect reports it as a SalesforceError
+        max_retries=_CappedRetry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False
+        )
+    )
+)
+
+# Attempts and base delay (seconds) when Salesforce answers HTTP 429 to a request
+# the adapter doesn't retry itself (POST and PATCH are not idempotent)
+_RATE_LIMIT_RETRIES = 3
+_RATE_LIMIT_BACKOFF = 0.5
+
+# Methods the adapter's Retry already retries on 429, _send leaves them alone
+_ADAPTER_RETRIED_METHODS = Retry.DEFAULT_ALLOWED_METHODS
+
+class SalesforceError(Exception):
+    """
+    Raised when Salesforce answers with an unexpected HTTP status.
+    """
+
+    def __init__(self, status_code, text):
+        super().__init__(f"{status_code}, {text}")
+        self.status_code = status_code
+        self.text = text
+
+def _retry_delay(response, attempt):
+    """
+    Seconds to wait before retrying a rate-limited request, preferring Retry-After.
+    """
+    retry_after = response.headers.get('Retry-After')
+    if retry_after and retry_after.isdigit():
+        return min(int(retry_after), _RATE_LIMIT_MAX_DELAY)
+    return min(_RATE_LIMIT_BACKOFF * (2 ** attempt), _RATE_LIMIT_MAX_DELAY)
+
+def _send(send, method, *args, **kwargs):
+    """
+    Call send (e.g. Session.request) and back off while Salesforce answers HTTP 429.
+
+    Only methods the adapter doesn't retry itself (POST, PATCH) are retried here,
+    so the two retry layers don't stack.
+    """
+    response = send(method, *args, **kwargs)
+    if method.upper() in _ADAPTER_RETRIED_METHODS:
+        return response
+    for attempt in range(_RATE_LIMIT_RETRIES):
+        if response.status_code != 429:
+            break
+        delay = _retry_delay(response, attempt)
+        response.close()
+        time.sleep(delay)
+        response = send(method, *args, **kwargs)
+    return response
+
+def _expect(response, ok=(200,)):
+    """
+    Return the response if its status is one of ok, raise SalesforceError otherwise.
+    """
+    if response.status_code not in ok:
+        raise SalesforceError(response.status_code, response.text)
+    return response
+
+def _records(response):
+    """
+    Return the records of a successful query response.
+    """
+    return _json(_expect(response)).get('records', [])
+
+def _json(response):
+    """
+    Decode a JSON response body with orjson instead of the stdlib json module.
+    """
+    return orjson.loads(response.content)
+
+def _iter_page_records(response):
+    """
+    Parse a streamed query response incrementally, yielding each record as it arrives.
+
+    Returns the page's nextRecordsUrl (None on the last page) once every record has been yielded.
+    """
+    response.raw.decode_content = True
+    next_records_url = None
+    builder = None
+    for prefix, event, value in ijson.parse(response.raw, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == 'records.item' and event == 'end_map':
+                yield builder.value
+                builder = None
+        elif prefix == 'records.item' and event == 'start_map':
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+        elif prefix == 'nextRecordsUrl':
+            next_records_url = value
+    return next_records_url
@@ -0,0 +1,72 @@
+import asyncio
+from agno.tools import tool
+from tools._sf_async import asf_request, async_client
+from tools._sf_http import SalesforceError, _expect, _json
+from tools.opp_salesforce_tools import (
+    DEFAULT_LIST_LIMIT,
+    _LEAD_FIELDS,
+    _OPPORTUNITY_FIELDS,
+    _build_list_query,
+    _displayed_options,
+    _format_leads,
+    _format_opportunities,
+    _get_cached_list,
+    _invalid_limit,
+    _parse_limit,
+    _set_cached_list
+)
+
+# Coroutine tools only work in arun/aprint_response, a sync run would hand the
+# model an un-awaited coroutine, so they live apart from the sync tool modules
+
+async def _afetch_list(client, name, fields, sobject, formatter, limit, force_refresh):
+    """
+    Async counterpart of _fetch_opportunities/_fetch_leads sharing the same list cache.
+    """
+    cache_key = (name, limit, False)
+    records = None if force_refresh else _get_cached_list(cache_key)
+
+    if records is None:
+        soql_query = _build_list_query(fields, sobject, limit, False)
+
+        try:
+            page = _json(_expect(await asf_request(client, 'GET', '/query', params={'q': soql_query})))
+            records = page.get('records', [])
+            # Follow further result pages, the LIMIT clause bounds the total
+            while page.get('nextRecordsUrl'):
+                page = _json(_expect(await asf_request(client, 'GET', page['nextRecordsUrl'])))
+                records.extend(page.get('records', []))
+        except SalesforceError as e:
+            return f"*❌ Error fetching {name}: {e}*", {}
+
+        _set_cached_list(cache_key, records)
+
+    return formatter(records), _displayed_options(name, records)
+
+@tool(description="Async variant of fetch_opportunities_and_leads for async agent runs; both queries share one HTTP/2 connection.")
+async def afetch_opportunities_and_leads(limit: int = DEFAULT_LIST_LIMIT, force_refresh: bool = False):
+    """
+    Fetch opportunities and leads concurrently over one HTTP/2 client.
+
+    Args:
+        limit (int): Maximum number of records to return for each list.
+        force_refresh (bool): Skip the cached results and query Salesforce again.
+
+    Returns:
+        tuple: A tuple containing (formatted_text, {"opportunities": opportunity_options_dict, "leads": lead_options_dict})
+    """
+    parsed_limit = _parse_limit(limit)
+    if parsed_limit is None:
+        return _invalid_limit(limit)
+    limit = parsed_limit
+
+    async with async_client() as client:
+        (formatted_opportunities, opportunity_options), (formatted_leads, lead_options) = await asyncio.gather(
+            _afetch_list(client, 'opportunities', _OPPORTUNITY_FIELDS, "Opportunity", _format_opportunities, limit, force_refresh),
+            _afetch_list(client, 'leads', _LEAD_FIELDS, "Lead", _format_leads, limit, force_refresh)
+        )
+
+    return (
+        f"{formatted_opportunities}\n{formatted_leads}",
+        {"opportunities": opportunity_options, "leads": lead_options}
+    )
@@ -1,31 +1,75 @@
-import os
-import requests
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from cachetools import TTLCache
 from agno.tools import tool
-
-# Get Access Token
-def get_access_token():
+from tools._sf_client import _CLIENT
+from tools._sf_http import SalesforceError
+
+# Recent list records, so "list then act" flows don't re-run the same SOQL query
+_LIST_CACHE = TTLCache(maxsize=64, ttl=30)
+_LIST_CACHE_LOCK = threading.Lock()
+
+# Option number -> ID map of the list last shown to the user, per list name, so a
+# numbered choice resolves to the record that was displayed under that number even
+# after the list was re-sorted or was fetched with another limit/fetch_all
+_DISPLAYED_OPTIONS = {}
+
+# Number of most recently modified records returned by the list tools by default
+DEFAULT_LIST_LIMIT = 50
+
+_OPPORTUNITY_FIELDS = "Id, Name, StageName, CloseDate, Amount"
+_LEAD_FIELDS = "Id, FirstName, LastName, Company, Email, LeadSource"
+
+# Per-record display templates, filled with str.format_map(record + option index)
+_OPPORTUNITY_TEMPLATE = (
+    "*Option {i} - Opportunity Name:* {Name}\n"
+    "*📅 Close Date:* {CloseDate}\n"
+    "*💰 Amount:* {Amount}\n"
+    "*📊 Stage:* {StageName}\n\n"
+)
+_LEAD_TEMPLATE = (
+    "*Option {i} - Lead Name:* {FirstName} {LastName}\n"
+    "*🏢 Company:* {Company}\n"
+    "*📧 Email:* {Email}\n"
+    "*🔗 Lead Source:* {LeadSource}\n\n"
+)
+
+def _get_cached_list(key):
+    with _LIST_CACHE_LOCK:
+        return _LIST_CACHE.get(key)
+
+def _set_cached_list(key, result):
+    with _LIST_CACHE_LOCK:
+        _LIST_CACHE[key] = result
+
+def _invalidate_cached_list(name):
+    with _LIST_CACHE_LOCK:
+        for key in [key for key in _LIST_CACHE if key[0] == name]:
+            _LIST_CACHE.pop(key, None)
+
+def _parse_limit(limit):
     """
-    Get an access token using the OAuth 2.0 Password Grant Flow.
+    Coerce a list limit passed by the model to an int of at least 1, None when it isn't a number.
     """
-    auth_url = 'https://login.salesforce.com/services/oauth2/token'
-    data = {
-        'grant_type': 'password',
-        'client_id': os.getenv("SF_CONSUMER_KEY"),
-        'client_secret': os.getenv("SF_CONSUMER_SECRET"),
-        'username': os.getenv("SF_USERNAME"),
-        'password': os.getenv("SF_PASSWORD") + os.getenv("SF_SECURITY_TOKEN")
-    }
+    try:
+        return max(int(limit), 1)
+    except (TypeError, ValueError):
+        return None
+
+def _invalid_limit(limit):
+    return f"*❌ Invalid limit `{limit}`. Please pass a whole number of records.*", {}
 
-    response = requests.post(auth_url, data=data)
+def _build_list_query(fields, sobject, limit, fetch_all):
+    """
+    Build a list SOQL query ordered by most recently modified first.
 
-    if response.status_code == 200:
-        response_data = response.json()
-        access_token = response_data.get('access_token')
-        instance_url = response_data.get('instance_url')
-        return access_token, instance_url
-    else:
-        raise Exception(f"Error fetching access token: {response.status_code}, {response.text}")
+    The LIMIT clause is omitted when every record is requested.
+    """
+    soql_query = f"SELECT {fields} FROM {sobject} ORDER BY LastModifiedDate DESC"
+    if not fetch_all:
+        soql_query += f" LIMIT {max(int(limit), 1)}"
+    return soql_query
 
 # Generate Prompt for Lifecycle Transition
 def generate_lifecycle_transition_prompt(opportunity_name, current_stage, new_stage):
@@ -47,50 +91,123 @@ def generate_lifecycle_transition_prompt(opportunity_name, current_stage, new_st
     """
     return prompt_template
 
+def _build_options(records):
+    """
+    Map option numbers, in display order, to record IDs.
+    """
+    return {index: record['Id'] for index, record in enumerate(records, start=1)}
+
+def _displayed_options(name, records):
+    """
+    Build the option map of a list that is about to be displayed and remember it.
+    """
+    options = _build_options(records)
+    _DISPLAYED_OPTIONS[name] = options
+    return options
+
+def _format_opportunities(records):
+    """
+    Format opportunity records for display.
+
+    Returns:
+        str: The formatted opportunities text.
+    """
+    if not records:
+        return "*❌ No opportunities found.*"
+
+    parts = ["*✅ Opportunities Retrieved Successfully!*\n\n"]
+
+    for index, record in enumerate(records, start=1):
+        parts.append(_OPPORTUNITY_TEMPLATE.format_map({**record, "i": index}))
+
+    return "".join(parts)
+
+def _format_leads(records):
+    """
+    Format lead records for display.
+
+    Returns:
+        str: The formatted leads text.
+    """
+    if not records:
+        return "*❌ No leads found.*"
+
+    parts = ["*✅ Leads Retrieved Successfully!*\n\n"]
+
+    for index, record in enumerate(records, start=1):
+        parts.append(_LEAD_TEMPLATE.format_map({**record, "i": index}))
+
+    return "".join(parts)
+
+def _list_opportunities_raw(limit=DEFAULT_LIST_LIMIT, fetch_all=False, force_refresh=False):
+    """
+    Query the most recently modified opportunities, reusing a recent result when cached.
+
+    Args:
+        limit (int): Maximum number of opportunities to return.
+        fetch_all (bool): Ignore the limit and page through every opportunity.
+        force_refresh (bool): Skip the cached result and query Salesforce again.
+
+    Returns:
+        list: The opportunity records.
+
+    Raises:
+        SalesforceError: If the query fails.
+    """
+    cache_key = ('opportunities', limit, fetch_all)
+    if not force_refresh:
+        cached = _get_cached_list(cache_key)
+        if cached is not None:
+            return cached
+
+    soql_query = _build_list_query(_OPPORTUNITY_FIELDS, "Opportunity", limit, fetch_all)
+
+    # Stream the query and collect the records as they are parsed, following further
+    # result pages too as a limit above one page (2000 rows) is still bounded by LIMIT
+    records = list(_CLIENT.iter_query(soql_query, fetch_all=True))
+    _set_cached_list(cache_key, records)
+    return records
+
 # Fetch All Opportunities and Present Them
-@tool(description="Fetch all opportunities from Salesforce and display them with ID for easy follow-up.")
-def fetch_opportunities():
+def _fetch_opportunities(limit=DEFAULT_LIST_LIMIT, fetch_all=False, force_refresh=False):
     """
-    Fetch all opportunities from Salesforce and display them with ID for easy follow-up.
-    
+    Query the most recently modified opportunities and build the option number -> ID index.
+
+    Kept undecorated so other tools in this module can call it directly.
+
+    Args:
+        limit (int): Maximum number of opportunities to return.
+        fetch_all (bool): Ignore the limit and page through every opportunity.
+        force_refresh (bool): Skip the cached result and query Salesforce again.
+
     Returns:
         tuple: A tuple containing (formatted_opportunities_text, opportunity_options_dict)
     """
-    soql_query = "SELECT Id, Name, StageName, CloseDate, Amount FROM Opportunity"
-    access_token, instance_url = get_access_token()
+    try:
+        records = _list_opportunities_raw(limit, fetch_all, force_refresh)
+    except SalesforceError as e:
+        return f"*❌ Error fetching opportunities: {e}*", {}
 
-    headers = {
-        'Authorization': f'Bearer {access_token}',
-        'Content-Type': 'application/json'
-    }
+    return _format_opportunities(records), _displayed_options('opportunities', records)
 
-    api_version = 'v57.0'
+@tool(description="Fetch the most recently modified opportunities from Salesforce (50 by default, set fetch_all for every record) and display them with ID for easy follow-up. Set force_refresh to bypass the short-lived cache.")
+def fetch_opportunities(limit: int = DEFAULT_LIST_LIMIT, fetch_all: bool = False, force_refresh: bool = False):
+    """
+    Fetch the most recently modified opportunities from Salesforce and display them with ID for easy follow-up.
+    
+    Args:
+        limit (int): Maximum number of opportunities to return.
+        fetch_all (bool): Ignore the limit and page through every opportunity.
+        force_refresh (bool): Skip the cached result and query Salesforce again.
 
-    # Send the GET request to Salesforce API to execute the query
-    response = requests.get(f'{instance_url}/services/data/{api_version}/query', headers=headers, params={'q': soql_query})
+    Returns:
+        tuple: A tuple containing (formatted_opportunities_text, opportunity_options_dict)
+    """
+    parsed_limit = _parse_limit(limit)
+    if parsed_limit is None:
+        return _invalid_limit(limit)
 
-    # Check the response and format the result
-    if response.status_code == 200:
-        records = response.json().get('records', [])
-        if not records:
-            return "*❌ No opportunities found.*", {}
-        
-        # Format the response
-        formatted_opportunities = "*✅ Opportunities Retrieved Successfully!*\n\n"
-        opportunity_options = {}
-        
-        for index, record in enumerate(records, start=1):
-            formatted_opportunities += (
-                f"*Option {index} - Opportunity Name:* {record['Name']}\n"
-                f"*📅 Close Date:* {record['CloseDate']}\n"
-                f"*💰 Amount:* {record['Amount']}\n"
-                f"*📊 Stage:* {record['StageName']}\n\n"
-            )
-            opportunity_options[index] = record['Id']
-
-        return formatted_opportunities, opportunity_options
-    else:
-        return f"*❌ Error fetching opportunities: {response.status_code}, {response.text}*", {}
+    return _fetch_opportunities(parsed_limit, fetch_all, force_refresh)
 
 # Fetch Opportunity Details by ID
 def fetch_opportunity_details(opportunity_id):
@@ -102,24 +219,42 @@ def fetch_opportunity_details(opportunity_id):
 
     Returns:
         dict: The opportunity details, including the current stage.
+
+    Raises:
+        SalesforceError: If the opportunity could not be fetched.
+    """
+    opportunity_url = f"/sobjects/Opportunity/{opportunity_id}"
+
+    # Send the GET request to Salesforce API to fetch the opportunity details
+    return _CLIENT.get_json(opportunity_url)  # Return full opportunity details
+
+def _update_opportunity_stage(opportunity_id, new_stage):
+    """
+    PATCH the stage of an opportunity and clear the cached opportunity list on success.
+
+    Kept undecorated so the lifecycle transition can reuse it.
+
+    Returns:
+        str: Success or failure message for the update.
     """
-    access_token, instance_url = get_access_token()
+    update_url = f"/sobjects/Opportunity/{opportunity_id}"
 
-    headers = {
-        'Authorization': f'Bearer {access_token}',
-        'Content-Type': 'application/json'
+    # Prepare the data to update
+    data = {
+        'StageName': new_stage
     }
 
-    api_version = 'v57.0'
-    opportunity_url = f"{instance_url}/services/data/{api_version}/sobjects/Opportunity/{opportunity_id}"
+    # Single-element composite batch, the same write path as the lifecycle transition
+    try:
+        [updated] = _CLIENT.composite([{'method': 'PATCH', 'url': update_url, 'referenceId': 'upd', 'body': data}])
+    except SalesforceError as e:
+        return f"❌ Failed to update stage: {e}"
 
-    # Send the GET request to Salesforce API to fetch the opportunity details
-    response = requests.get(opportunity_url, headers=headers)
+    if updated.get('httpStatusCode') != 204:
+        return f"❌ Failed to update stage: {updated.get('httpStatusCode')}, {updated.get('body')}"
 
-    if response.status_code == 200:
-        return response.json()  # Return full opportunity details
-    else:
-        raise Exception(f"Error fetching opportunity details: {response.status_code}, {response.text}")
+    _invalidate_cached_list('opportunities')
+    return f"🎉 Opportunity stage successfully updated to {new_stage}!"
 
 # Update Opportunity Stage in Salesforce
 @tool(description="Update the stage of an opportunity in Salesforce.")
@@ -134,27 +269,7 @@ def update_opportunity_stage(opportunity_id: str, new_stage: str):
     Returns:
         str: Success or failure message for the update.
     """
-    access_token, instance_url = get_access_token()
-
-    headers = {
-        'Authorization': f'Bearer {access_token}',
-        'Content-Type': 'application/json'
-    }
-
-    api_version = 'v57.0'
-    update_url = f"{instance_url}/services/data/{api_version}/sobjects/Opportunity/{opportunity_id}"
-
-    # Prepare the data to update
-    data = {
-        'StageName': new_stage
-    }
-
-    response = requests.patch(update_url, headers=headers, json=data)
-
-    if response.status_code == 204:
-        return f"🎉 Opportunity stage successfully updated to {new_stage}!"
-    else:
-        return f"❌ Failed to update stage: {response.status_code}, {response.text}"
+    return _update_opportunity_stage(opportunity_id, new_stage)
 
 # Validate and Update Lifecycle Transition
 @tool(description="Validate and update the lifecycle stage of an opportunity based on user-selected option.")
@@ -169,11 +284,27 @@ def validate_and_update_lifecycle_transition(opportunity_choice: int, new_stage:
     Returns:
         str: Enhanced response with details about the transition.
     """
-    # Fetch opportunities
-    formatted_opportunities, opportunity_options = fetch_opportunities()
+    # LLMs sometimes pass the option number as a string, normalise before any lookup
+    try:
+        opportunity_choice = int(opportunity_choice)
+    except (TypeError, ValueError):
+        return "*❌ Invalid option selected. Please choose a valid option.*"
+
+    # Resolve the choice against the list the user was shown, with whatever
+    # limit/fetch_all it was fetched with
+    opportunity_options = _DISPLAYED_OPTIONS.get('opportunities')
+
+    if opportunity_options is None:
+        # Nothing listed yet, fall back to the default listing without formatting it
+        try:
+            records = _list_opportunities_raw()
+        except SalesforceError as e:
+            return f"*❌ Error fetching opportunities: {e}*"
+
+        opportunity_options = _build_options(records)
 
     if not opportunity_options:
-        return formatted_opportunities  # No opportunities found
+        return "*❌ No opportunities found.*"
 
     # Validate user-selected opportunity
     if opportunity_choice not in opportunity_options:
@@ -182,8 +313,13 @@ def validate_and_update_lifecycle_transition(opportunity_choice: int, new_stage:
     # Get the opportunity ID based on the user selection
     opportunity_id = opportunity_options[opportunity_choice]
 
-    # Fetch current opportunity details (including current stage)
-    opportunity_details = fetch_opportunity_details(opportunity_id)
+    # Read the current stage first, an unchanged stage must not be written back
+    # (a no-op PATCH still fires triggers and bumps LastModifiedDate)
+    try:
+        opportunity_details = fetch_opportunity_details(opportunity_id)
+    except SalesforceError as e:
+        return f"*❌ Error fetching opportunity details: {e}*"
+
     current_stage = opportunity_details.get('StageName', 'Not Available')
 
     # Check if the current stage is the same as the new stage
@@ -193,8 +329,7 @@ def validate_and_update_lifecycle_transition(opportunity_choice: int, new_stage:
     # Generate lifecycle transition prompt
     lifecycle_prompt = generate_lifecycle_transition_prompt(opportunity_details['Name'], current_stage, new_stage)
 
-    # Call the function to perform update
-    update_message = update_opportunity_stage(opportunity_id, new_stage)
+    update_message = _update_opportunity_stage(opportunity_id, new_stage)
 
     # Format the final response with opportunity details
     enhanced_response = f"""
@@ -213,48 +348,100 @@ def validate_and_update_lifecycle_transition(opportunity_choice: int, new_stage:
     """
     return enhanced_response
 
-@tool(description="Fetch all leads from Salesforce and display them with ID for follow-up.")
-def fetch_leads():
+def _list_leads_raw(limit=DEFAULT_LIST_LIMIT, fetch_all=False, force_refresh=False):
     """
-    Fetch all leads from Salesforce and display them with ID for follow-up.
-    
+    Query the most recently modified leads, reusing a recent result when cached.
+
+    Args:
+        limit (int): Maximum number of leads to return.
+        fetch_all (bool): Ignore the limit and page through every lead.
+        force_refresh (bool): Skip the cached result and query Salesforce again.
+
+    Returns:
+        list: The lead records.
+
+    Raises:
+        SalesforceError: If the query fails.
+    """
+    cache_key = ('leads', limit, fetch_all)
+    if not force_refresh:
+        cached = _get_cached_list(cache_key)
+        if cached is not None:
+            return cached
+
+    soql_query = _build_list_query(_LEAD_FIELDS, "Lead", limit, fetch_all)
+
+    # Stream the query and collect the records as they are parsed, following further
+    # result pages too as a limit above one page (2000 rows) is still bounded by LIMIT
+    records = list(_CLIENT.iter_query(soql_query, fetch_all=True))
+    _set_cached_list(cache_key, records)
+    return records
+
+def _fetch_leads(limit=DEFAULT_LIST_LIMIT, fetch_all=False, force_refresh=False):
+    """
+    Query the most recently modified leads and build the option number -> ID index.
+
+    Args:
+        limit (int): Maximum number of leads to return.
+        fetch_all (bool): Ignore the limit and page through every lead.
+        force_refresh (bool): Skip the cached result and query Salesforce again.
+
     Returns:
         tuple: A tuple containing (formatted_leads_text, lead_options_dict)
     """
-    soql_query = "SELECT Id, FirstName, LastName, Company, Email, LeadSource FROM Lead"
-    access_token, instance_url = get_access_token()
+    try:
+        records = _list_leads_raw(limit, fetch_all, force_refresh)
+    except SalesforceError as e:
+        return f"*❌ Error fetching leads: {e}*", {}
 
-    headers = {
-        'Authorization': f'Bearer {access_token}',
-        'Content-Type': 'application/json'
-    }
+    return _format_leads(records), _displayed_options('leads', records)
 
-    api_version = 'v57.0'
+@tool(description="Fetch the most recently modified leads from Salesforce (50 by default, set fetch_all for every record) and display them with ID for follow-up. Set force_refresh to bypass the short-lived cache.")
+def fetch_leads(limit: int = DEFAULT_LIST_LIMIT, fetch_all: bool = False, force_refresh: bool = False):
+    """
+    Fetch the most recently modified leads from Salesforce and display them with ID for follow-up.
+    
+    Args:
+        limit (int): Maximum number of leads to return.
+        fetch_all (bool): Ignore the limit and page through every lead.
+        force_refresh (bool): Skip the cached result and query Salesforce again.
 
-    # Send the GET request to Salesforce API to execute the query
-    response = requests.get(f'{instance_url}/services/data/{api_version}/query', headers=headers, params={'q': soql_query})
+    Returns:
+        tuple: A tuple containing (formatted_leads_text, lead_options_dict)
+    """
+    parsed_limit = _parse_limit(limit)
+    if parsed_limit is None:
+        return _invalid_limit(limit)
 
-    if response.status_code == 200:
-        records = response.json().get('records', [])
-        if not records:
-            return "*❌ No leads found.*", {}
+    return _fetch_leads(parsed_limit, fetch_all, force_refresh)
 
-        # Format the response
-        formatted_leads = "*✅ Leads Retrieved Successfully!*\n\n"
-        lead_options = {}
+@tool(description="Fetch the most recently modified opportunities and leads from Salesforce in parallel and display them with ID for follow-up.")
+def fetch_opportunities_and_leads(limit: int = DEFAULT_LIST_LIMIT, force_refresh: bool = False):
+    """
+    Fetch opportunities and leads concurrently, as the two queries are independent.
 
-        for index, record in enumerate(records, start=1):
-            formatted_leads += (
-                f"*Option {index} - Lead Name:* {record.get('FirstName', '')} {record.get('LastName', '')}\n"
-                f"*🏢 Company:* {record.get('Company', '')}\n"
-                f"*📧 Email:* {record.get('Email', '')}\n"
-                f"*🔗 Lead Source:* {record.get('LeadSource', '')}\n\n"
-            )
-            lead_options[index] = record['Id']
+    Args:
+        limit (int): Maximum number of records to return for each list.
+        force_refresh (bool): Skip the cached results and query Salesforce again.
 
-        return formatted_leads, lead_options
-    else:
-        return f"*❌ Error fetching leads: {response.status_code}, {response.text}*", {}
+    Returns:
+        tuple: A tuple containing (formatted_text, {"opportunities": opportunity_options_dict, "leads": lead_options_dict})
+    """
+    parsed_limit = _parse_limit(limit)
+    if parsed_limit is None:
+        return _invalid_limit(limit)
+    limit = parsed_limit
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        opportunities_future = executor.submit(_fetch_opportunities, limit, False, force_refresh)
+        leads_future = executor.submit(_fetch_leads, limit, False, force_refresh)
+        formatted_opportunities, opportunity_options = opportunities_future.result()
+        formatted_leads, lead_options = leads_future.result()
+
+    return (
+        f"{formatted_opportunities}\n{formatted_leads}",
+        {"opportunities": opportunity_options, "leads": lead_options}
+    )
 
 @tool(description="Get detailed information about a lead by ID")
 def get_lead_details(lead_id: str):
@@ -267,37 +454,27 @@ def get_lead_details(lead_id: str):
     Returns:
         str: Formatted lead details
     """
-    access_token, instance_url = get_access_token()
-
-    headers = {
-        'Authorization': f'Bearer {access_token}',
-        'Content-Type': 'application/json'
-    }
-
-    api_version = 'v57.0'
-    lead_url = f"{instance_url}/services/data/{api_version}/sobjects/Lead/{lead_id}"
+    lead_url = f"/sobjects/Lead/{lead_id}"
 
     # Fetch the lead details
-    response = requests.get(lead_url, headers=headers)
-
-    if response.status_code == 200:
-        lead_details = response.json()
-        
-        # Format the lead details for display
-        formatted_details = f"""
-        📊 **Lead Details**:
-        
-        👤 **Name**: {lead_details.get('FirstName', '')} {lead_details.get('LastName', '')}
-        🏢 **Company**: {lead_details.get('Company', '')}
-        📧 **Email**: {lead_details.get('Email', '')}
-        📱 **Phone**: {lead_details.get('Phone', '')}
-        🔗 **Lead Source**: {lead_details.get('LeadSource', '')}
-        🏆 **Status**: {lead_details.get('Status', '')}
-        """
-        
-        return formatted_details
-    else:
-        return f"*❌ Error fetching lead details: {response.status_code}, {response.text}*"
+    try:
+        lead_details = _CLIENT.get_json(lead_url)
+    except SalesforceError as e:
+        return f"*❌ Error fetching lead details: {e}*"
+    
+    # Format the lead details for display
+    formatted_details = f"""
+    📊 **Lead Details**:
+    
+    👤 **Name**: {lead_details.get('FirstName', '')} {lead_details.get('LastName', '')}
+    🏢 **Company**: {lead_details.get('Company', '')}
+    📧 **Email**: {lead_details.get('Email', '')}
+    📱 **Phone**: {lead_details.get('Phone', '')}
+    🔗 **Lead Source**: {lead_details.get('LeadSource', '')}
+    🏆 **Status**: {lead_details.get('Status', '')}
+    """
+    
+    return formatted_details
 
 @tool(description="Generate personalized email template for a lead using their details")
 def get_lead_email_info(lead_id: str):
@@ -310,29 +487,16 @@ def get_lead_email_info(lead_id: str):
     Returns:
         dict: Lead information needed for email generation
     """
-    access_token, instance_url = get_access_token()
-
-    headers = {
-        'Authorization': f'Bearer {access_token}',
-        'Content-Type': 'application/json'
-    }
-
-    api_version = 'v57.0'
-    lead_url = f"{instance_url}/services/data/{api_version}/sobjects/Lead/{lead_id}"
+    lead_url = f"/sobjects/Lead/{lead_id}"
 
     # Fetch the lead details
-    response = requests.get(lead_url, headers=headers)
-
-    if response.status_code == 200:
-        lead_details = response.json()
-        
-        # Return information for email generation
-        return {
-            "first_name": lead_details.get('FirstName', ''),
-            "last_name": lead_details.get('LastName', ''),
-            "company": lead_details.get('Company', ''),
-            "lead_source": lead_details.get('LeadSource', ''),
-            "email": lead_details.get('Email', '')
-        }
-    else:
-        raise Exception(f"Error fetching lead details: {response.status_code}, {response.text}")
\ No newline at end of file
+    lead_details = _CLIENT.get_json(lead_url)
+    
+    # Return information for email generation
+    return {
+        "first_name": lead_details.get('FirstName', ''),
+        "last_name": lead_details.get('LastName', ''),
+        "company": lead_details.get('Company', ''),
+        "lead_source": lead_details.get('LeadSource', ''),
+        "email": lead_details.get('Email', '')
+    }
\ No newline at end of file
@@ -1,33 +1,39 @@
-import os
-import requests
+import re
 import json
+from itertools import islice
+from typing import Any, Dict, List, Optional
 from agno.tools import tool
+from tools._sf_client import _CLIENT
+from tools._sf_http import SalesforceError, _expect, _json, _records
+from tools.opp_salesforce_tools import _invalidate_cached_list
 
-def get_access_token():
-    """
-    Get an access token using the OAuth 2.0 Password Grant Flow.
-    """
-    auth_url = 'https://login.salesforce.com/services/oauth2/token'
-
-    # Request parameters for the password grant flow
-    data = {
-        'grant_type': 'password',
-        'client_id': os.getenv("SF_CONSUMER_KEY"),
-        'client_secret': os.getenv("SF_CONSUMER_SECRET"),
-        'username': os.getenv("SF_USERNAME"),
-        'password': os.getenv("SF_PASSWORD")+os.getenv("SF_SECURITY_TOKEN")
-    }
+# Case numbers are auto-numbered digit strings, anything else is rejected before it reaches SOQL
+_CASE_NUMBER_PATTERN = re.compile(r'^[0-9]{5,10}$')
+
+# Width of the default Case auto-number format (00000000), used to restore the
+# leading zeros of case numbers passed without them
+_CASE_NUMBER_WIDTH = 8
+
+# Newest comments first, filtered through the Parent relationship instead of a semi-join
+_CASE_COMMENTS_QUERY = (
+    "SELECT Id, CommentBody, CreatedDate, Parent.CaseNumber FROM CaseComment "
+    "WHERE Parent.CaseNumber = '{case_number}' ORDER BY CreatedDate DESC LIMIT 200"
+)
+
+# Subrequest methods accepted by the composite resource
+_COMPOSITE_METHODS = ('GET', 'POST', 'PATCH', 'DELETE')
+
+# sObject written by a composite subrequest, e.g. 'sobjects/Opportunity/006...' -> Opportunity
+_SOBJECT_URL_PATTERN = re.compile(r'sobjects/(\w+)')
 
-    # Send POST request to get the access token
-    response = requests.post(auth_url, data=data)
+# Cached list tools to clear when their sObject is written through execute_composite
+_CACHED_LISTS = {'Opportunity': 'opportunities', 'Lead': 'leads'}
 
-    if response.status_code == 200:
-        response_data = response.json()
-        access_token = response_data.get('access_token')
-        instance_url = response_data.get('instance_url')
-        return access_token, instance_url
-    else:
-        raise Exception(f"Error fetching access token: {response.status_code}, {response.text}")
+# Per-comment display template, filled with str.format_map(record)
+_COMMENT_TEMPLATE = (
+    "*📝 Comment:* {CommentBody}\n"
+    "*📅 Created On:* {CreatedDate}\n\n"
+)
 
 @tool(description="Fetch case comments from Salesforce for a specific case number and summarize them.")
 def fetch_case_comments(case_number: str):
@@ -40,50 +46,41 @@ def fetch_case_comments(case_number: str):
     Returns:
         str: Case comments summary with creation dates.
     """
-    
-    # Get Salesforce access token and instance URL
-    access_token, instance_url = get_access_token()
+    case_number = str(case_number).strip()
+    # Integers (and strings the model built from them) lose their leading zeros
+    if case_number.isdigit():
+        case_number = case_number.zfill(_CASE_NUMBER_WIDTH)
+    if not _CASE_NUMBER_PATTERN.match(case_number):
+        return f"*❌ Invalid case number `{case_number}`. Expected a case number of 5 to 10 digits, e.g. `00001026`.*"
 
     # Define the query to retrieve the case comments
-    query = f"SELECT Id, CommentBody, CreatedDate FROM CaseComment WHERE ParentId IN (SELECT Id FROM Case WHERE CaseNumber = '{case_number}')"
+    query = _CASE_COMMENTS_QUERY.format(case_number=case_number)
 
-    # Define headers for the request
-    headers = {
-        'Authorization': f'Bearer {access_token}',
-        'Content-Type': 'application/json'
-    }
+    # Send the GET request to Salesforce API to fetch case comments
+    try:
+        case_comments = _records(_CLIENT.get('/query', params={'q': query}))
+    except SalesforceError as e:
+        return f"*❌ Error fetching case comments: {e}*"
 
-    # Salesforce API version
-    api_version = 'v57.0'
+    if not case_comments:
+        return "*❌ No comments found for this case number.*"
+    
+    # In Agno, we don't directly use OpenAI or other LLMs within tools
+    # Instead, we collect and format the data for the main agent to process
+    
+    # Format comments for display
+    parts = []
+    for comment in case_comments:
+        parts.append(_COMMENT_TEMPLATE.format_map(comment))
+    
+    formatted_comments = "".join(parts)
 
-    # Send the GET request to Salesforce API to fetch case comments
-    response = requests.get(f'{instance_url}/services/data/{api_version}/query', headers=headers, params={'q': query})
-
-    # Check the response status and return the case comments
-    if response.status_code == 200:
-        case_comments = response.json().get('records', [])
-        if not case_comments:
-            return "*❌ No comments found for this case number.*"
-        
-        # In Agno, we don't directly use OpenAI or other LLMs within tools
-        # Instead, we collect and format the data for the main agent to process
-        
-        # Format comments for display
-        formatted_comments = ""
-        for comment in case_comments:
-            formatted_comments += (
-                f"*📝 Comment:* {comment['CommentBody']}\n"
-                f"*📅 Created On:* {comment['CreatedDate']}\n\n"
-            )
-        
-        # Return the raw comments - the agent will handle summarization
-        return (
-            "*✅ Case Comments Retrieved Successfully!*\n\n"
-            f"*🎫 Case Number:* `{case_number}`\n\n"
-            f"*🔎 Full Comments:* \n{formatted_comments}"
-        )
-    else:
-        return f"*❌ Error fetching case comments: {response.status_code}, {response.text}*"
+    # Return the raw comments - the agent will handle summarization
+    return (
+        "*✅ Case Comments Retrieved Successfully!*\n\n"
+        f"*🎫 Case Number:* `{case_number}`\n\n"
+        f"*🔎 Full Comments:* \n{formatted_comments}"
+    )
 
 @tool(description="Create a new case in Salesforce with subject, description and priority.")
 def create_case_in_salesforce(case_subject: str, case_description: str, case_priority: str):
@@ -99,9 +96,6 @@ def create_case_in_salesforce(case_subject: str, case_description: str, case_pri
         str: Confirmation and case details.
     """
     
-    # Get Salesforce access token and instance URL
-    access_token, instance_url = get_access_token()
-
     # Define the data to create a new case
     case_data = {
         "Subject": case_subject,
@@ -111,33 +105,22 @@ def create_case_in_salesforce(case_subject: str, case_description: str, case_pri
         "Origin": "Web"
     }
 
-    # Define headers for the request
-    headers = {
-        'Authorization': f'Bearer {access_token}',
-        'Content-Type': 'application/json'
-    }
-
-    # Salesforce API version
-    api_version = 'v57.0'
-
     # Send the POST request to Salesforce API to create a new case
-    response = requests.post(f'{instance_url}/services/data/{api_version}/sobjects/Case/', headers=headers, json=case_data)
-
-    # Check the response status and return case creation details
-    if response.status_code == 201:
-        created_case = response.json()
-        case_id = created_case.get('id')
-
-        return (
-            "*✅ Case Created Successfully!*\n\n"
-            f"*🎫 Case ID:* `{case_id}`\n\n"
-            f"*🔎 Case Details:*\n"
-            f"Subject: {case_subject}\n"
-            f"Description: {case_description}\n"
-            f"Priority: {case_priority}"
-        )
-    else:
-        return f"*❌ Error creating case: {response.status_code}, {response.text}*"
+    try:
+        created_case = _json(_expect(_CLIENT.post('/sobjects/Case/', json=case_data), ok=(201,)))
+    except SalesforceError as e:
+        return f"*❌ Error creating case: {e}*"
+
+    case_id = created_case.get('id')
+
+    return (
+        "*✅ Case Created Successfully!*\n\n"
+        f"*🎫 Case ID:* `{case_id}`\n\n"
+        f"*🔎 Case Details:*\n"
+        f"Subject: {case_subject}\n"
+        f"Description: {case_description}\n"
+        f"Priority: {case_priority}"
+    )
     
 @tool(description="Delete a specific case in Salesforce by its case ID.")
 def delete_case_in_salesforce(case_id: str):
@@ -151,52 +134,83 @@ def delete_case_in_salesforce(case_id: str):
         str: Confirmation message whether the case was deleted or not.
     """
     
-    # Get Salesforce access token and instance URL
-    access_token, instance_url = get_access_token()
-
-    # Define headers for the request
-    headers = {
-        'Authorization': f'Bearer {access_token}',
-        'Content-Type': 'application/json'
-    }
-
-    # Salesforce API version
-    api_version = 'v57.0'
+    # Send the DELETE as a single-element composite batch
+    try:
+        [deleted] = _CLIENT.composite([{'method': 'DELETE', 'url': f'/sobjects/Case/{case_id}', 'referenceId': 'del'}])
+    except SalesforceError as e:
+        return f"*❌ Error deleting the case with ID `{case_id}`: {e}*"
 
-    # Send the DELETE request to Salesforce API to delete the case
-    response = requests.delete(f'{instance_url}/services/data/{api_version}/sobjects/Case/{case_id}', headers=headers)
+    if deleted.get('httpStatusCode') != 204:
+        return f"*❌ Error deleting the case with ID `{case_id}`: {deleted.get('httpStatusCode')}, {deleted.get('body')}*"
 
-    # Check the response status and return case deletion result
-    if response.status_code == 204:
-        return f"*✅ Case with ID `{case_id}` was deleted successfully!*"
-    else:
-        return f"*❌ Error deleting the case with ID `{case_id}`: {response.status_code}, {response.text}*"
+    return f"*✅ Case with ID `{case_id}` was deleted successfully!*"
 
-@tool(description="Execute a SOQL query in Salesforce.")
-def execute_soql_query(soql_query: str):
+@tool(description="Execute a SOQL query in Salesforce. Set top_k to stop reading after that many records.")
+def execute_soql_query(soql_query: str, top_k: Optional[int] = None):
     """
     Execute a SOQL query in Salesforce.
     
     Args:
         soql_query (str): The SOQL query to execute.
+        top_k (int, optional): Stop reading the response after this many records.
     
     Returns:
         str: The result of the executed SOQL query.
     """
     
-    # Get Salesforce access token and instance URL
-    access_token, instance_url = get_access_token()
-    
-    headers = {
-        'Authorization': f'Bearer {access_token}',
-        'Content-Type': 'application/json'
-    }
-
-    api_version = 'v57.0'
+    # Stream the query response, stopping early once top_k records have been read
+    try:
+        records = list(islice(_CLIENT.iter_query(soql_query), top_k))
+    except SalesforceError as e:
+        return f"*❌ Error executing SOQL query: {e}*"
+
+    return f"*✅ Query Executed Successfully!*\n\n```\n{json.dumps(records, indent=2)}\n```"
+
+@tool(description=(
+    "Execute up to 25 Salesforce REST operations in a single request. "
+    "subrequests is a list of objects with 'method' (GET, POST, PATCH or DELETE), "
+    "'url' relative to the REST API root (e.g. '/sobjects/Case/500XXXXXXXXXXXX'), "
+    "'referenceId' (letters, digits and underscores) and, for POST and PATCH, a 'body' object. "
+    "Later subrequests can use results of earlier ones with '@{referenceId.field}', e.g. '@{newCase.id}'. "
+    "Subrequests run independently, a failed one doesn't roll back the others."
+))
+def execute_composite(subrequests: List[Dict[str, Any]]):
+    """
+    Execute several Salesforce REST operations in one composite request.
 
-    # Send the GET request to Salesforce API to execute the query
-    response = requests.get(f'{instance_url}/services/data/{api_version}/query', headers=headers, params={'q': soql_query})
+    Args:
+        subrequests (list): Dicts with method, url, referenceId and an optional body.
 
-    # Check the response and format the result
-    if response.status_code == 200:
-        records = response.json().get('records', [])
\ No newline at end of file
+    Returns:
+        str: The HTTP status and decoded body of every subrequest.
+    """
+    if not subrequests:
+        return "*❌ No subrequests given.*"
+
+    for subrequest in subrequests:
+        if not (
+            isinstance(subrequest, dict)
+            and isinstance(subrequest.get('url'), str)
+            and str(subrequest.get('method', '')).upper() in _COMPOSITE_METHODS
+        ):
+            return f"*❌ Invalid subrequest `{subrequest}`. Every subrequest needs a 'method' (GET, POST, PATCH or DELETE) and a 'url'.*"
+
+    try:
+        results = _CLIENT.composite(subrequests)
+    except SalesforceError as e:
+        return f"*❌ Error executing composite request: {e}*"
+
+    # Writes go around the list tools, clear their cached lists as they would
+    for subrequest, result in zip(subrequests, results):
+        match = _SOBJECT_URL_PATTERN.search(subrequest['url'])
+        if subrequest['method'].upper() != 'GET' and match and match.group(1) in _CACHED_LISTS:
+            if 200 <= (result.get('httpStatusCode') or 0) < 300:
+                _invalidate_cached_list(_CACHED_LISTS[match.group(1)])
+
+    parts = []
+    for result in results:
+        parts.append(f"*🔹 {result.get('referenceId')}:* {result.get('httpStatusCode')}\n")
+        if result.get('body') is not None:
+            parts.append(f"```\n{json.dumps(result['body'], indent=2)}\n```\n")
+
+    return "*✅ Composite Request Executed!*\n\n" + "".join(parts)